@@ -1,58 +1,61 @@
 import os
+import hashlib
+from collections import OrderedDict
 from dotenv import load_dotenv
 import google.generativeai as genai
 import streamlit as st
-from io import BytesIO
-
-try:
-    from PyPDF2 import PdfReader
-except ImportError:
-    st.error("Please install PyPDF2: pip install PyPDF2")
-    st.stop() 
-try:
-    from docx import Document
-except ImportError:
-    st.error("Please install python-docx: pip install python-docx")
-    st.stop() 
----
-load_dotenv()
-API_KEY = os.getenv('GOOGLE_API_KEY')
-
-
-if not API_KEY:
-    st.error("Error: GOOGLE_API_KEY environment variable not set.")
-    st.info("Please set it in your .env file in the project root (e.g., GOOGLE_API_KEY='your_api_key').")
-    st.stop()
-genai.configure(api_key=API_KEY)
+from resume_readers import read_pdf, read_docx, read_txt
+from resume_batches import BATCH_RESPONSE_SCHEMA, BATCH_SIZE, parse_batch_analysis
 
-MODEL_NAME = 'gemini-1.5-flash'  
+# Streamlit re-executes this script on every interaction; configure the SDK once per session
+if not st.session_state.get('_genai_ready'):
+    load_dotenv()
+    API_KEY = os.getenv('GOOGLE_API_KEY')
 
-def read_pdf(file):
-    """Extracts text from PDF files"""
-    pdf = PdfReader(BytesIO(file.read()))
-    text = ""
-    for page in pdf.pages:
-        text += page.extract_text() or ""  
-    return text
+    if not API_KEY:
+        st.error("Error: GOOGLE_API_KEY environment variable not set.")
+        st.info("Please set it in your .env file in the project root (e.g., GOOGLE_API_KEY='your_api_key').")
+        st.stop()
+    genai.configure(api_key=API_KEY)
+    st.session_state._genai_ready = True
 
-def read_docx(file):
-    doc = Document(BytesIO(file.read()))
-    return "\n".join([paragraph.text for paragraph in doc.paragraphs if paragraph.text])
+MODEL_NAME = 'gemini-1.5-flash'  
+MAX_INPUT_CHARS = 20000 # Per document; anything longer only inflates prompt cost
+MAX_STORED_ANALYSES = 20 # Per session; the oldest results are dropped first
 
-def read_txt(file):
-    return file.read().decode("utf-8")
-
-def get_resume_analysis(job_description: str, resume_text: str):
-    analysis_prompt = f"""
-    You are an expert resume analysis AI. Analyze this resume against the job description and provide:
+@st.cache_resource
+def _get_model():
+    return genai.GenerativeModel(MODEL_NAME)
 
+ANALYSIS_CRITERIA = """
     1. Match Score (1-100%)
     2. Key Strengths (3-5 bullet points)
     3. Missing Keywords/Skills (3-5 bullet points)
     4. Areas for Improvement (2-3 actionable suggestions)
     5. Professional Summary
     6. Selection Chance Assessment (Low/Moderate/High/Very High)
-
+"""
+
+def clip_input(text: str, label: str):
+    if len(text) <= MAX_INPUT_CHARS:
+        return text
+    st.info(f"{label} is longer than {MAX_INPUT_CHARS:,} characters, so only the first {MAX_INPUT_CHARS:,} are analyzed.")
+    return text[:MAX_INPUT_CHARS]
+
+def analysis_key(job_description: str, *resume_texts: str):
+    return hashlib.sha256("\0".join((job_description, *resume_texts)).encode("utf-8")).hexdigest()
+
+def remember_analyses(key: str, analyses: list):
+    stored = st.session_state.analyses
+    stored[key] = analyses
+    stored.move_to_end(key)
+    while len(stored) > MAX_STORED_ANALYSES:
+        stored.popitem(last=False)
+
+def build_analysis_prompt(job_description: str, resume_text: str):
+    return f"""
+    You are an expert resume analysis AI. Analyze this resume against the job description and provide:
+    {ANALYSIS_CRITERIA}
     Job Description:
     {job_description}
 
@@ -62,9 +65,54 @@ def get_resume_analysis(job_description: str, resume_text: str):
     Be concise, professional, and brutally honest.
     """
 
-    model = genai.GenerativeModel(MODEL_NAME)
-    response = model.generate_content(analysis_prompt)
-    return response.text, response.prompt_feedback, response.candidates
+def get_resume_analysis(job_description: str, resume_text: str):
+    """Starts a streamed analysis; iterate the returned response for text chunks"""
+    model = _get_model()
+    return model.generate_content(build_analysis_prompt(job_description, resume_text), stream=True)
+
+def _analyze_batch(job_description: str, resume_texts: list):
+    """Analyzes several resumes against one job description in a single request"""
+    resumes = "\n\n".join(f"Resume {number}:\n{text}" for number, text in enumerate(resume_texts, 1))
+    batch_prompt = f"""
+    You are an expert resume analysis AI. Analyze each of the {len(resume_texts)} resumes below against the job description and provide, for each resume:
+    {ANALYSIS_CRITERIA}
+    Job Description:
+    {job_description}
+
+    {resumes}
+
+    Be concise, professional, and brutally honest.
+    Respond with a JSON array holding one object per resume, in order:
+    {{"resume": <resume number>, "analysis": "<the full analysis as Markdown>"}}
+    """
+
+    model = _get_model()
+    response = model.generate_content(
+        batch_prompt,
+        generation_config={
+            "response_mime_type": "application/json",
+            "response_schema": BATCH_RESPONSE_SCHEMA,
+        }
+    )
+    if response.candidates and response.candidates[0].finish_reason.name == "MAX_TOKENS":
+        # The JSON reply was cut off at the output limit and can't be parsed
+        return [None] * len(resume_texts)
+    return parse_batch_analysis(response.text, len(resume_texts))
+
+def get_batch_resume_analysis(job_description: str, resume_texts: list):
+    """Analyzes resumes BATCH_SIZE at a time, retrying any the batch replies missed one by one"""
+    analyses = []
+    for start in range(0, len(resume_texts), BATCH_SIZE):
+        analyses.extend(_analyze_batch(job_description, resume_texts[start:start + BATCH_SIZE]))
+
+    missing = [index for index, analysis in enumerate(analyses) if analysis is None]
+    if missing:
+        st.info(f"{len(missing)} resume(s) were missing from the combined reply and were analyzed one at a time.")
+    model = _get_model()
+    for index in missing:
+        response = model.generate_content(build_analysis_prompt(job_description, resume_texts[index]))
+        analyses[index] = response.text
+    return analyses
     
 st.set_page_config(
     page_title="Resume Analyzer Pro",
@@ -74,92 +122,119 @@ st.set_page_config(
 
 if 'theme' not in st.session_state:
     st.session_state.theme = 'light'
+if 'analyses' not in st.session_state:
+    st.session_state.analyses = OrderedDict()
+if 'resume_previews' not in st.session_state:
+    st.session_state.resume_previews = {}
 
 def toggle_theme():
     st.session_state.theme = 'dark' if st.session_state.theme == 'light' else 'light'
 
-theme = st.session_state.theme
-primary_bg = "#FFFFFF" if theme == 'light' else "#1E1E1E"
-secondary_bg = "#E0E2E6" if theme == 'light' else "#2D2D2D" # Slightly darker for better contrast in light mode
-text_color = "#000000" if theme == 'light' else "#F0F2F6"
-button_bg_color = "#000000" if theme == 'light' else "#1E88E5" # Green for light, Blue for dark
-
-st.markdown(f"""
+# Streamlit drops any element a rerun doesn't emit, so the stylesheet is still
+# sent every run; it is a constant though, and only the :root block varies.
+STATIC_CSS = """
     <style>
     /* General app background and text color */
-    .stApp {{
-        background-color: {primary_bg};
-        color: {text_color};
-    }}
+    .stApp {
+        background-color: var(--primary-bg);
+        color: var(--text-color);
+    }
 
     /* Headers */
-    h1, h2, h3, h4, h5, h6 {{
-        color: {text_color};
-    }}
+    h1, h2, h3, h4, h5, h6 {
+        color: var(--text-color);
+    }
     /* More specific selectors for Streamlit text elements */
-    .stMarkdown, .stMarkdown p, .stMarkdown li, .stMarkdown ul, .stMarkdown ol {{
-        color: {text_color};
-    }}
+    .stMarkdown, .stMarkdown p, .stMarkdown li, .stMarkdown ul, .stMarkdown ol {
+        color: var(--text-color);
+    }
 
     /* Input Fields: Text Areas and Text Inputs */
-    .stTextArea textarea, .stTextInput input {{
-        background-color: {secondary_bg};
-        color: {text_color};
+    .stTextArea textarea, .stTextInput input {
+        background-color: var(--secondary-bg);
+        color: var(--text-color);
         border: 1px solid #555555;
-    }}
+    }
     /* Placeholder text color for text areas and text inputs */
-    .stTextArea textarea::placeholder, .stTextInput input::placeholder {{
-        color: {'#999999' if theme == 'light' else '#BBBBBB'}; /* Darker gray for light, lighter for dark */
+    .stTextArea textarea::placeholder, .stTextInput input::placeholder {
+        color: var(--placeholder-color);
         opacity: 1; /* Ensure placeholder is not transparent */
-    }}
+    }
 
     /* Buttons */
-    .stButton > button {{
-        background-color: {button_bg_color} !important;
+    .stButton > button {
+        background-color: var(--button-bg) !important;
         color: white !important;
         border: none;
         padding: 10px 20px;
         border-radius: 5px;
         cursor: pointer;
         font-weight: bold;
-    }}
-    .stButton > button:hover {{
+    }
+    .stButton > button:hover {
         opacity: 0.9;
-    }}
+    }
 
     /* Radio buttons and their labels */
-    .stRadio > label {{
-        color: {text_color};
-    }}
-    .stRadio .st-dk {{ /* Target the actual radio button circles/text */
-        color: {text_color};
-    }}
+    .stRadio > label {
+        color: var(--text-color);
+    }
+    .stRadio .st-dk { /* Target the actual radio button circles/text */
+        color: var(--text-color);
+    }
 
     /* File uploader label */
-    .stFileUploader label span {{
-        color: {text_color};
-    }}
+    .stFileUploader label span {
+        color: var(--text-color);
+    }
     /* File uploader box */
-    .stFileUploader > div > div {{
-        background-color: {secondary_bg};
+    .stFileUploader > div > div {
+        background-color: var(--secondary-bg);
         border: 1px solid #555555;
-    }}
+    }
 
 
     /* Expander text */
-    .streamlit-expanderHeader {{
-        color: {text_color};
-    }}
-    .streamlit-expanderContent {{
-        color: {text_color};
-    }}
+    .streamlit-expanderHeader {
+        color: var(--text-color);
+    }
+    .streamlit-expanderContent {
+        color: var(--text-color);
+    }
 
     /* General labels (if not covered by other selectors) */
-    .st-d{{
-        color: {text_color};
-    }}
+    .st-d{
+        color: var(--text-color);
+    }
     </style>
-""", unsafe_allow_html=True)
+"""
+
+THEME_COLORS = {
+    'light': {
+        'primary-bg': "#FFFFFF",
+        'secondary-bg': "#E0E2E6", # Slightly darker for better contrast in light mode
+        'text-color': "#000000",
+        'button-bg': "#000000",
+        'placeholder-color': "#999999", # Darker gray for light
+    },
+    'dark': {
+        'primary-bg': "#1E1E1E",
+        'secondary-bg': "#2D2D2D",
+        'text-color': "#F0F2F6",
+        'button-bg': "#1E88E5",
+        'placeholder-color': "#BBBBBB", # Lighter gray for dark
+    },
+}
+
+@st.cache_data
+def theme_css(theme):
+    variables = "".join(f"--{name}:{value};" for name, value in THEME_COLORS[theme].items())
+    return f"<style>:root{{{variables}}}</style>"
+
+theme = st.session_state.theme
+
+st.html(STATIC_CSS)
+st.html(theme_css(theme))
 
 col1, col2 = st.columns([0.85, 0.15])
 with col1:
@@ -181,7 +256,7 @@ job_description = st.text_area(
 )
 
 st.header("2. Resume Input 📝")
-resume_text = ""
+resumes = []
 
 upload_option = st.radio(
     "Choose input method:",
@@ -191,26 +266,39 @@ upload_option = st.radio(
 )
 
 if upload_option == "Upload File":
-    uploaded_file = st.file_uploader(
-        "Upload resume (PDF, DOCX, TXT)",
+    uploaded_files = st.file_uploader(
+        "Upload one or more resumes (PDF, DOCX, TXT)",
         type=["pdf", "docx", "txt"],
+        accept_multiple_files=True,
         label_visibility="visible" 
     )
 
-    if uploaded_file:
+    previews = {}
+    for uploaded_file in uploaded_files:
         try:
+            resume_text = ""
+            file_bytes = uploaded_file.getvalue()
             if uploaded_file.type == "application/pdf":
-                resume_text = read_pdf(uploaded_file)
+                resume_text = read_pdf(file_bytes)
             elif uploaded_file.type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-                resume_text = read_docx(uploaded_file)
+                resume_text = read_docx(file_bytes)
             elif uploaded_file.type == "text/plain":
-                resume_text = read_txt(uploaded_file)
+                resume_text = read_txt(file_bytes)
+            resumes.append((uploaded_file.name, resume_text))
 
-            with st.expander("Preview Resume Content (First 2000 characters)"):
-                st.text(resume_text[:2000] + ("..." if len(resume_text) > 2000 else ""))
+            preview = st.session_state.resume_previews.get(uploaded_file.file_id)
+            if preview is None:
+                preview = resume_text[:2000] + ("..." if len(resume_text) > 2000 else "")
+            previews[uploaded_file.file_id] = preview
 
+            with st.expander(f"Preview {uploaded_file.name} (First 2000 characters)"):
+                st.text(preview)
+
+        except ImportError as e:
+            st.error(str(e))
         except Exception as e:
-            st.error(f"Error processing file: {str(e)}")
+            st.error(f"Error processing {uploaded_file.name}: {str(e)}")
+    st.session_state.resume_previews = previews
 else: 
     resume_text = st.text_area(
         "Paste your resume text here:",
@@ -218,25 +306,49 @@ else:
         placeholder="John Doe\nSenior Software Engineer...",
         label_visibility="visible"
     )
+    resumes.append(("Pasted resume", resume_text))
+
+resumes = [(name, text) for name, text in resumes if text.strip()]
 
 st.divider()
 if st.button("🚀 Analyze Resume", type="primary"):
     if not job_description.strip():
         st.warning("Please provide a job description")
-    elif not resume_text.strip():
+    elif not resumes:
         st.warning("Please provide your resume")
     else:
-        with st.spinner("Analyzing..."):
-            try:
-                analysis, feedback, candidates = get_resume_analysis(job_description, resume_text)
+        try:
+            names = [name for name, _ in resumes]
+            job_description = clip_input(job_description, "The job description")
+            resume_texts = [clip_input(text, name) for name, text in resumes]
+            key = analysis_key(job_description, *resume_texts)
+            analyses = st.session_state.analyses.get(key)
+            if analyses is None and len(resumes) == 1:
+                with st.spinner("Analyzing..."):
+                    response = get_resume_analysis(job_description, resume_texts[0])
 
-                st.success("Analysis Complete!")
                 st.subheader("📊 Analysis Results")
-                st.markdown(analysis)
+                text = st.write_stream(chunk.text for chunk in response)
+                remember_analyses(key, [text])
+            else:
+                if analyses is None:
+                    with st.spinner(f"Analyzing {len(resumes)} resumes..."):
+                        analyses = get_batch_resume_analysis(job_description, resume_texts)
+                remember_analyses(key, analyses)
 
-            except Exception as e:
-                st.error(f"Analysis failed: {str(e)}")
-                st.info("Common fixes: Check API key, internet connection, or try shorter text")
+                st.subheader("📊 Analysis Results")
+                if len(analyses) == 1:
+                    st.markdown(analyses[0])
+                else:
+                    for tab, analysis in zip(st.tabs(names), analyses):
+                        with tab:
+                            st.markdown(analysis)
+
+            st.success("Analysis Complete!")
+
+        except Exception as e:
+            st.error(f"Analysis failed: {str(e)}")
+            st.info("Common fixes: Check API key, internet connection, or try shorter text")
 
 st.header("Got Feedback? We'd Love to Hear From You! 💬")
 st.markdown("""
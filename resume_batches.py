@@ -0,0 +1,56 @@
+"""Structured output for analyzing several resumes in one Gemini request"""
+import json
+
+# Keeps the combined JSON reply well inside gemini-1.5-flash's 8192-token output limit
+BATCH_SIZE = 5
+
+BATCH_RESPONSE_SCHEMA = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": {
+            "resume": {"type": "integer"},
+            "analysis": {"type": "string"},
+        },
+        "required": ["resume", "analysis"],
+    },
+}
+
+def _resume_number(item):
+    try:
+        return int(item["resume"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+def parse_batch_analysis(raw: str, count: int):
+    """Maps the model's JSON reply back onto resumes 1..count.
+
+    Items are placed by their resume number first. Only when the reply holds exactly
+    `count` items are the slots still empty filled by position. A slot left as None
+    got no usable analysis, which is also the result for a truncated reply.
+    """
+    try:
+        items = json.loads(raw)
+    except json.JSONDecodeError:
+        return [None] * count
+    if isinstance(items, dict):
+        # A single object, or an object wrapping the array
+        items = next((value for value in items.values() if isinstance(value, list)), [items])
+    if not isinstance(items, list):
+        return [None] * count
+
+    usable = [isinstance(item, dict) and "analysis" in item for item in items]
+    numbers = [_resume_number(item) if ok else None for item, ok in zip(items, usable)]
+
+    results = [None] * count
+    placed = [False] * len(items)
+    for index, number in enumerate(numbers):
+        if number is not None and 1 <= number <= count and numbers.count(number) == 1:
+            results[number - 1] = str(items[index]["analysis"])
+            placed[index] = True
+
+    if len(items) == count:
+        for index, item in enumerate(items):
+            if results[index] is None and usable[index] and not placed[index]:
+                results[index] = str(item["analysis"])
+    return results
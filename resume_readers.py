@@ -0,0 +1,86 @@
+"""Text extraction for uploaded resume files"""
+import zipfile
+from io import BytesIO
+
+import streamlit as st
+
+@st.cache_data(show_spinner=False)
+def read_pdf(data: bytes):
+    """Extracts text from PDF files"""
+    try:
+        import fitz
+    except ImportError as e:
+        raise ImportError("Please install PyMuPDF: pip install pymupdf") from e
+
+    doc = fitz.open(stream=data, filetype="pdf")
+    try:
+        # Serial on purpose: PyMuPDF holds the GIL while extracting and is not
+        # thread-safe, so a thread pool over pages would add risk, not speed.
+        parts = [page.get_text("text") for page in doc]
+        return "\n".join(parts)
+    finally:
+        doc.close()
+
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+W_TEXT = W_NS + "t"
+W_BR = W_NS + "br"
+DOCX_BREAKS = {W_NS + "tab": "\t", W_NS + "ptab": "\t", W_BR: "\n", W_NS + "cr": "\n", W_NS + "noBreakHyphen": "-"}
+DOCX_NSMAP = {"w": W_NS[1:-1]}
+# Body and table-cell paragraphs only. Text boxes sit inside runs and Word writes
+# each one twice (mc:Choice and mc:Fallback), so they are skipped like python-docx does.
+DOCX_PARAGRAPHS = "w:body/w:p | w:body/w:tbl//w:tc/w:p"
+DOCX_RUN_CONTENT = "w:r/* | w:hyperlink/w:r/*"
+
+def _docx_run_text(node):
+    if node.tag == W_TEXT:
+        return node.text or ""
+    if node.tag == W_BR and node.get(W_NS + "type", "textWrapping") != "textWrapping":
+        return ""  # Page and column breaks
+    return DOCX_BREAKS.get(node.tag, "")
+
+def _read_docx_xml(data: bytes):
+    """Pulls paragraph text straight out of word/document.xml with one lxml parse.
+
+    Returns None when the archive can't be read this way, so the caller can fall
+    back to python-docx.
+    """
+    from lxml import etree
+
+    # Same hardening python-docx applies to its own parser
+    parser = etree.XMLParser(resolve_entities=False, no_network=True)
+    try:
+        with zipfile.ZipFile(BytesIO(data)) as archive:
+            root = etree.fromstring(archive.read("word/document.xml"), parser)
+    except (KeyError, zipfile.BadZipFile, etree.XMLSyntaxError):
+        return None
+
+    lines = []
+    for paragraph in root.xpath(DOCX_PARAGRAPHS, namespaces=DOCX_NSMAP):
+        text = "".join(
+            _docx_run_text(node) for node in paragraph.xpath(DOCX_RUN_CONTENT, namespaces=DOCX_NSMAP)
+        )
+        if text:
+            lines.append(text)
+    return "\n".join(lines)
+
+@st.cache_data(show_spinner=False)
+def read_docx(data: bytes):
+    try:
+        text = _read_docx_xml(data)
+        if text is None:
+            from docx import Document
+    except ImportError as e:
+        raise ImportError("Please install python-docx: pip install python-docx") from e
+
+    if text is None:
+        doc = Document(BytesIO(data))
+        text = "\n".join([paragraph.text for paragraph in doc.paragraphs if paragraph.text])
+    return text
+
+@st.cache_data(show_spinner=False)
+def read_txt(data: bytes):
+    try:
+        return data.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        # Most non-UTF-8 resumes come from Windows editors
+        return data.decode("cp1252", errors="replace")
@@ -0,0 +1,55 @@
+import json
+
+from resume_batches import parse_batch_analysis
+
+
+def _reply(*items):
+    return json.dumps(list(items))
+
+
+def test_places_items_by_number_when_reordered():
+    raw = _reply({"resume": 2, "analysis": "B"}, {"resume": 1, "analysis": "A"})
+
+    assert parse_batch_analysis(raw, 2) == ["A", "B"]
+
+
+def test_accepts_numbers_sent_as_strings():
+    raw = _reply({"resume": "1", "analysis": "A"}, {"resume": "2", "analysis": "B"})
+
+    assert parse_batch_analysis(raw, 2) == ["A", "B"]
+
+
+def test_accepts_array_wrapped_in_an_object():
+    raw = json.dumps({"results": [{"resume": 2, "analysis": "B"}, {"resume": 1, "analysis": "A"}]})
+
+    assert parse_batch_analysis(raw, 2) == ["A", "B"]
+
+
+def test_accepts_a_single_top_level_object():
+    raw = json.dumps({"resume": 1, "analysis": "A"})
+
+    assert parse_batch_analysis(raw, 2) == ["A", None]
+
+
+def test_out_of_range_number_does_not_displace_a_valid_one():
+    raw = _reply({"resume": 3, "analysis": "C"}, {"resume": 1, "analysis": "A"})
+
+    assert parse_batch_analysis(raw, 2) == ["A", None]
+
+
+def test_duplicate_numbers_fall_back_to_position_when_counts_match():
+    raw = _reply({"resume": 1, "analysis": "A"}, {"resume": 1, "analysis": "B"})
+
+    assert parse_batch_analysis(raw, 2) == ["A", "B"]
+
+
+def test_no_positional_fallback_when_item_count_differs():
+    raw = _reply({"resume": 9, "analysis": "X"})
+
+    assert parse_batch_analysis(raw, 2) == [None, None]
+
+
+def test_truncated_reply_leaves_every_slot_empty():
+    raw = _reply({"resume": 1, "analysis": "A"}, {"resume": 2, "analysis": "B"})[:-20]
+
+    assert parse_batch_analysis(raw, 2) == [None, None]
@@ -0,0 +1,85 @@
+import sys
+import zipfile
+from io import BytesIO
+
+import pytest
+
+docx = pytest.importorskip("docx")
+pytest.importorskip("lxml")
+
+from resume_readers import read_docx
+
+TEXT_BOX_RUN = """
+<w:r xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+     xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"
+     xmlns:wps="http://schemas.microsoft.com/office/word/2010/wordprocessingShape"
+     xmlns:v="urn:schemas-microsoft-com:vml">
+  <mc:AlternateContent>
+    <mc:Choice Requires="wps">
+      <w:drawing><wps:txbx><w:txbxContent>
+        <w:p><w:r><w:t>BOXTEXT</w:t></w:r></w:p>
+      </w:txbxContent></wps:txbx></w:drawing>
+    </mc:Choice>
+    <mc:Fallback>
+      <w:pict><v:shape><v:textbox><w:txbxContent>
+        <w:p><w:r><w:t>BOXTEXT</w:t></w:r></w:p>
+      </w:txbxContent></v:textbox></v:shape></w:pict>
+    </mc:Fallback>
+  </mc:AlternateContent>
+</w:r>
+"""
+
+
+def _docx_bytes(document):
+    buffer = BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def test_read_docx_matches_python_docx_paragraphs_with_text_box():
+    from docx.oxml import parse_xml
+
+    document = docx.Document()
+    document.add_paragraph("John Doe")
+    anchor = document.add_paragraph("after box")
+    anchor._p.append(parse_xml(TEXT_BOX_RUN))
+    skills = document.add_paragraph("Python\t")
+    skills.add_run("SQL")
+    data = _docx_bytes(document)
+
+    expected = "\n".join(p.text for p in docx.Document(BytesIO(data)).paragraphs if p.text)
+    assert read_docx(data) == expected
+    assert "BOXTEXT" not in read_docx(data)
+
+
+def test_read_docx_includes_table_cells():
+    document = docx.Document()
+    document.add_paragraph("Skills")
+    document.add_table(rows=1, cols=1).cell(0, 0).text = "Python"
+
+    assert read_docx(_docx_bytes(document)) == "Skills\nPython"
+
+
+def test_read_docx_does_not_expand_external_entities(tmp_path):
+    secret = tmp_path / "secret.txt"
+    secret.write_text("TOP SECRET")
+    document_xml = f"""<?xml version="1.0"?>
+<!DOCTYPE w:document [<!ENTITY leak SYSTEM "file://{secret}">]>
+<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
+  <w:body><w:p><w:r><w:t>Jane &leak;</w:t></w:r></w:p></w:body>
+</w:document>"""
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("word/document.xml", document_xml)
+
+    assert "TOP SECRET" not in read_docx(buffer.getvalue())
+
+
+def test_read_docx_skips_python_docx_import_on_fast_path(monkeypatch):
+    document = docx.Document()
+    document.add_paragraph("Jane Doe")
+    data = _docx_bytes(document)
+    monkeypatch.setitem(sys.modules, "docx", None)
+    read_docx.clear()
+
+    assert read_docx(data) == "Jane Doe"